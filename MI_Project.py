@@ -1,6 +1,18 @@
 import tkinter as tk
 from tkinter import ttk
+import threading
 import time
+from collections import deque
+
+try:
+    import search_nb
+except ImportError:  # numba is optional, the pure Python search always works
+    search_nb = None
+
+try:
+    from search import alpha_beta_c
+except ImportError:  # Cython extension not built (python setup.py build_ext --inplace)
+    alpha_beta_c = None
 
 ###############################################################################
 # Game Logic and Data Structures
@@ -10,49 +22,46 @@ class Player:
     HUMAN = 0
     COMPUTER = 1
 
+MULTIPLIERS = (2, 3, 4)  # The moves available to both players
+
 class GameState:
+    __slots__ = ("current_number", "human_score", "computer_score", "current_player")
+
     def __init__(self, current_number, human_score, computer_score, current_player):
         self.current_number = current_number
         self.human_score = human_score
         self.computer_score = computer_score
         self.current_player = current_player
 
-    def copy(self):
-        return GameState(
-            self.current_number,
-            self.human_score,
-            self.computer_score,
-            self.current_player
-        )
-
 def is_terminal(state):
     """
     The game ends as soon as the current number is >= 1200.
     """
     return state.current_number >= 1200
 
-def evaluate(state):
+def evaluate(human_score, computer_score, terminal):
     """
     Heuristic/evaluation function for Minimax or Alpha-Beta.
     - If the state is terminal, return a large positive/negative score 
       if the computer is winning/losing, or 0 if tied.
     - Otherwise, use the score difference (computer_score - human_score).
-    """
-    if is_terminal(state):
-        if state.human_score > state.computer_score:
-            return -999999  # Big negative => losing for computer
-        elif state.computer_score > state.human_score:
-            return 999999   # Big positive => winning for computer
-        else:
-            return 0        # Tie
-    else:
-        # Non-terminal: difference in scores
-        return state.computer_score - state.human_score
 
-def get_successors(state):
+    The caller has already tested for the end of the game and passes the
+    result in as `terminal`; the return value is always an int.
     """
-    Generates all possible next states for Minimax/Alpha-Beta by multiplying
-    the current number by 2, 3, or 4 and applying the scoring rules:
+    diff = computer_score - human_score
+    if terminal:
+        # Only the sign of the final difference matters:
+        # big positive => winning for computer, big negative => losing, 0 => tie
+        return 999999 if diff > 0 else -999999 if diff < 0 else 0
+    # Non-terminal: difference in scores
+    return diff
+
+def child_state(cur_num, hs, cs, player, multiplier):
+    """
+    Returns the (current_number, human_score, computer_score, current_player)
+    tuple reached by multiplying the current number by 2, 3, or 4 and
+    applying the scoring rules:
 
       - If the result is even => opponent's points -1
       - If the result is odd  => current player's points +1
@@ -60,117 +69,264 @@ def get_successors(state):
 
     We do switch the turn only if the game does not end.
     """
-    if is_terminal(state):
-        return []
-
-    successors = []
-    for multiplier in [2, 3, 4]:
-        child = state.copy()
-        new_number = child.current_number * multiplier
-        child.current_number = new_number
+    new_number = cur_num * multiplier
 
-        # Determine if it's even or odd
-        if new_number % 2 == 0:
-            # Even => Opponent loses 1 point
-            if child.current_player == Player.HUMAN:
-                child.computer_score -= 1
-            else:
-                child.human_score -= 1
+    # Determine if it's even or odd
+    if new_number % 2 == 0:
+        # Even => Opponent loses 1 point
+        if player == Player.HUMAN:
+            cs -= 1
         else:
-            # Odd => Current player gains 1 point
-            if child.current_player == Player.HUMAN:
-                child.human_score += 1
-            else:
-                child.computer_score += 1
+            hs -= 1
+    else:
+        # Odd => Current player gains 1 point
+        if player == Player.HUMAN:
+            hs += 1
+        else:
+            cs += 1
 
-        # Check if game ends
-        if new_number < 1200:
-            # Switch player if not terminal
-            if child.current_player == Player.HUMAN:
-                child.current_player = Player.COMPUTER
-            else:
-                child.current_player = Player.HUMAN
-        # If new_number >= 1200, the game ends immediately (no turn switch)
+    # Switch player if not terminal; if new_number >= 1200, the game ends
+    # immediately (no turn switch)
+    if new_number < 1200:
+        player = 1 - player
 
-        successors.append((multiplier, child))
+    return new_number, hs, cs, player
 
-    return successors
+def iter_successors(state):
+    """
+    Yields (multiplier, child state tuple) for each move from a non-terminal
+    state tuple, without building an intermediate list.
+    """
+    for multiplier in MULTIPLIERS:
+        yield multiplier, child_state(*state, multiplier)
+
+def make_move(state, multiplier):
+    """
+    Applies a move to the GameState in place (see child_state for the rules).
+    """
+    (state.current_number, state.human_score,
+     state.computer_score, state.current_player) = child_state(
+        state.current_number, state.human_score,
+        state.computer_score, state.current_player, multiplier)
 
 ###############################################################################
 # Minimax and Alpha-Beta
 ###############################################################################
 
-NODES_VISITED = 0  # For tracking how many nodes are expanded (useful for experiments)
-
-def minimax(state, depth, maximizing_player):
-    global NODES_VISITED
-    NODES_VISITED += 1
-
+# Alpha/beta window sentinel; larger than any evaluation, and an int so the
+# search never mixes floats into its values
+INF = 10 ** 9
+
+# Transposition table flags: the stored value is exact, a lower bound (the node
+# failed high) or an upper bound (the node failed low).
+EXACT, LOWER, UPPER = 0, 1, 2
+
+# Transposition table: state key -> (depth, value, best_move, flag).
+# The reachable state space is small, so the same position is reached through
+# many different move orders; caching it turns the game tree into a DAG.
+TT = {}
+
+# Static move ordering for Alpha-Beta, indexed by the parity of the current
+# number. On an odd number x3 is the only move that keeps the result odd and
+# so earns the player to move a point, which makes it the likely best move.
+# On an even number every result is even and scores the same, so x4 goes first:
+# it brings the end of the game closest and has the smallest subtree.
+MOVE_ORDER = ((4, 2, 3), (3, 4, 2))
+
+# The search works on plain ints (current number, human score, computer score,
+# current player) rather than GameState objects: every field access is then a
+# local variable lookup and the state is directly usable as a TT key.
+# Every search also returns how many nodes it expanded (useful for
+# experiments), counted in a local variable instead of a global counter.
+
+def minimax(cur_num, hs, cs, player, depth, maximizing_player):
     # Base case: depth limit or terminal state
-    if depth == 0 or is_terminal(state):
-        return evaluate(state), None
-
-    if maximizing_player:
-        best_value = float('-inf')
-        best_move = None
-        for move, child_state in get_successors(state):
-            val, _ = minimax(child_state, depth - 1, False)
+    terminal = cur_num >= 1200
+    if terminal or depth == 0:
+        return evaluate(hs, cs, terminal), None, 1
+
+    key = (cur_num, hs, cs, player)
+    entry = TT.get(key)
+    if entry is not None and entry[0] >= depth and entry[3] == EXACT:
+        return entry[1], entry[2], 1
+
+    nodes = 1
+    best_value = -INF if maximizing_player else INF
+    best_move = None
+    child_depth = depth - 1
+    child_maximizing = not maximizing_player
+    for move, child in iter_successors(key):
+        val, _, child_nodes = minimax(*child, child_depth, child_maximizing)
+        nodes += child_nodes
+        if maximizing_player:
             if val > best_value:
                 best_value = val
                 best_move = move
-        return best_value, best_move
-    else:
-        best_value = float('inf')
-        best_move = None
-        for move, child_state in get_successors(state):
-            val, _ = minimax(child_state, depth - 1, True)
-            if val < best_value:
-                best_value = val
-                best_move = move
-        return best_value, best_move
-
-def alpha_beta(state, depth, alpha, beta, maximizing_player):
-    global NODES_VISITED
-    NODES_VISITED += 1
-
-    if depth == 0 or is_terminal(state):
-        return evaluate(state), None
-
-    if maximizing_player:
-        best_value = float('-inf')
-        best_move = None
-        for move, child_state in get_successors(state):
-            val, _ = alpha_beta(child_state, depth - 1, alpha, beta, False)
+        elif val < best_value:
+            best_value = val
+            best_move = move
+
+    TT[key] = (depth, best_value, best_move, EXACT)
+    return best_value, best_move, nodes
+
+def alpha_beta(cur_num, hs, cs, player, depth, alpha, beta, maximizing_player):
+    terminal = cur_num >= 1200
+    if terminal or depth == 0:
+        return evaluate(hs, cs, terminal), None, 1
+
+    # Probe the transposition table
+    key = (cur_num, hs, cs, player)
+    entry = TT.get(key)
+    hash_move = None
+    if entry is not None:
+        entry_depth, value, hash_move, flag = entry
+        if entry_depth >= depth and (
+                flag == EXACT
+                or (flag == LOWER and value >= beta)
+                or (flag == UPPER and value <= alpha)):
+            return value, hash_move, 1
+
+    # Try the best move stored in the TT first, then the static ordering
+    order = MOVE_ORDER[cur_num & 1]
+    if hash_move is not None and hash_move != order[0]:
+        order = (hash_move,) + tuple(m for m in order if m != hash_move)
+
+    alpha_orig, beta_orig = alpha, beta
+
+    nodes = 1
+    best_value = -INF if maximizing_player else INF
+    best_move = None
+    child_depth = depth - 1
+    child_maximizing = not maximizing_player
+    for move in order:
+        # Inlined copy of child_state, kept here because this is the hot
+        # loop; it must apply exactly the same rules
+        new_num = cur_num * move
+        if new_num & 1:
+            # Odd => Current player gains 1 point
+            if player == Player.HUMAN:
+                child_hs, child_cs = hs + 1, cs
+            else:
+                child_hs, child_cs = hs, cs + 1
+        elif player == Player.HUMAN:
+            # Even => Opponent loses 1 point
+            child_hs, child_cs = hs, cs - 1
+        else:
+            child_hs, child_cs = hs - 1, cs
+        # Switch player only if the game does not end
+        child_player = player if new_num >= 1200 else 1 - player
+
+        val, _, child_nodes = alpha_beta(new_num, child_hs, child_cs, child_player,
+                                         child_depth, alpha, beta, child_maximizing)
+        nodes += child_nodes
+        if maximizing_player:
             if val > best_value:
                 best_value = val
                 best_move = move
             alpha = max(alpha, best_value)
-            if alpha >= beta:
-                break  # Alpha-Beta prune
-        return best_value, best_move
-    else:
-        best_value = float('inf')
-        best_move = None
-        for move, child_state in get_successors(state):
-            val, _ = alpha_beta(child_state, depth - 1, alpha, beta, True)
+        else:
             if val < best_value:
                 best_value = val
                 best_move = move
             beta = min(beta, best_value)
-            if beta <= alpha:
-                break  # Alpha-Beta prune
-        return best_value, best_move
+        if alpha >= beta:
+            break  # Alpha-Beta prune
+
+    # Store the result together with the kind of bound it represents
+    if best_value <= alpha_orig:
+        flag = UPPER
+    elif best_value >= beta_orig:
+        flag = LOWER
+    else:
+        flag = EXACT
+    TT[key] = (depth, best_value, best_move, flag)
+    return best_value, best_move, nodes
+
+def plies_to_end(cur_num):
+    """
+    Upper bound on the number of moves left: even always choosing x2, the
+    game is over once the number reaches 1200. Searching deeper than this
+    gives exactly the same result.
+    """
+    plies = 0
+    while cur_num < 1200:
+        cur_num *= 2
+        plies += 1
+    return plies
+
+# Precomputed solution: the game always ends (the number only grows), and from
+# any initial number there are only a few hundred reachable states, so the
+# whole game graph can be solved exactly once and every later move is a lookup.
+GAME_VALUE = {}  # state key -> minimax value with perfect play to the end
+BEST_MOVE = {}   # state key -> multiplier achieving GAME_VALUE
+
+def solve_game(cur_num, hs, cs, player):
+    """
+    Enumerate every state reachable from the given one (breadth-first) and
+    fill GAME_VALUE/BEST_MOVE for all of them. States solved by an earlier
+    call are not expanded again. Returns the number of newly solved states.
+    """
+    root = (cur_num, hs, cs, player)
+    reached = set()
+    if root not in GAME_VALUE:
+        reached.add(root)
+    queue = deque(reached)
+    while queue:
+        state = queue.popleft()
+        if state[0] >= 1200:
+            continue
+        for _, child in iter_successors(state):
+            if child not in reached and child not in GAME_VALUE:
+                reached.add(child)
+                queue.append(child)
+
+    # Every move multiplies the number, so sorting by decreasing number is a
+    # reverse topological order: all children are solved before their parent.
+    # The children are generated again instead of keeping adjacency lists.
+    for state in sorted(reached, key=lambda s: s[0], reverse=True):
+        if state[0] >= 1200:
+            GAME_VALUE[state] = evaluate(state[1], state[2], True)
+            continue
+        maximizing = state[3] == Player.COMPUTER
+        best_value = -INF if maximizing else INF
+        best_move = None
+        for move, child in iter_successors(state):
+            val = GAME_VALUE[child]
+            if val > best_value if maximizing else val < best_value:
+                best_value = val
+                best_move = move
+        GAME_VALUE[state] = best_value
+        BEST_MOVE[state] = best_move
+    return len(reached)
 
 def computer_move(state, algorithm, depth=10):
     """
     Decide which multiplier (2, 3, or 4) the computer will use,
-    based on the selected algorithm (Minimax or Alpha-Beta).
+    based on the selected algorithm (Minimax, Alpha-Beta, the exact
+    precomputed solution or the numba/Cython-compiled Alpha-Beta).
+
+    Returns (move, visited nodes, search depth); the depth is None for the
+    precomputed solution, which always looks to the end of the game.
     """
+    args = (state.current_number, state.human_score,
+            state.computer_score, state.current_player)
     if algorithm == "Minimax":
-        _, move = minimax(state, depth, True)
+        _, move, nodes = minimax(*args, depth, True)
+    elif algorithm == "Precomputed":
+        nodes = 0
+        if args not in BEST_MOVE:
+            nodes = solve_game(*args)
+        move = BEST_MOVE[args]
+        depth = None
+    elif algorithm == "Alpha-Beta (JIT)":
+        _, move, nodes = search_nb.ab(*args, depth, -search_nb.INF,
+                                      search_nb.INF, True)
+    elif algorithm == "Alpha-Beta (Cython)":
+        _, move, nodes = alpha_beta_c(*args, depth, -INF, INF, True)
     else:
-        _, move = alpha_beta(state, depth, float('-inf'), float('inf'), True)
-    return move
+        depth = min(depth, plies_to_end(state.current_number))
+        _, move, nodes = alpha_beta(*args, depth, -INF, INF, True)
+    return move, nodes, depth
 
 ###############################################################################
 # Tkinter GUI
@@ -193,10 +349,14 @@ class GameGUI:
         # Game state variables
         self.state = None
         self.game_over = False
+        self.game_id = 0  # Incremented per game, to drop results of stale searches
+        self.pending_turn = None  # `after` id of a scheduled computer_turn
+        self.search_game_id = None  # game_id of the search in flight, if any
 
         # Tracking stats
         self.nodes_label_var = tk.StringVar(value="Visited Nodes: 0")
         self.time_label_var = tk.StringVar(value="Move Time: 0.000s")
+        self.depth_label_var = tk.StringVar(value="Search Depth: 0")
         self.status_label_var = tk.StringVar(value="No game in progress.")
 
         # Scoreboard variables
@@ -220,7 +380,12 @@ class GameGUI:
         who_menu.grid(row=1, column=1, sticky=tk.W, padx=5)
 
         ttk.Label(top_frame, text="Algorithm:").grid(row=2, column=0, sticky=tk.W, padx=5)
-        algo_menu = ttk.OptionMenu(top_frame, self.algorithm, "Minimax", "Minimax", "Alpha-Beta")
+        algorithms = ["Minimax", "Alpha-Beta", "Precomputed"]
+        if search_nb is not None:
+            algorithms.append("Alpha-Beta (JIT)")
+        if alpha_beta_c is not None:
+            algorithms.append("Alpha-Beta (Cython)")
+        algo_menu = ttk.OptionMenu(top_frame, self.algorithm, "Minimax", *algorithms)
         algo_menu.grid(row=2, column=1, sticky=tk.W, padx=5)
 
         start_btn = ttk.Button(top_frame, text="Start Game", command=self.start_game)
@@ -243,22 +408,25 @@ class GameGUI:
         ttk.Label(mid_frame, textvariable=self.status_label_var, foreground="blue").pack(anchor=tk.W)
         ttk.Label(mid_frame, textvariable=self.nodes_label_var).pack(anchor=tk.W)
         ttk.Label(mid_frame, textvariable=self.time_label_var).pack(anchor=tk.W)
+        ttk.Label(mid_frame, textvariable=self.depth_label_var).pack(anchor=tk.W)
 
         # Bottom frame for moves
         bottom_frame = ttk.Frame(self.root, padding=10)
         bottom_frame.pack(side=tk.TOP, fill=tk.X)
 
         ttk.Label(bottom_frame, text="Your Move: ").pack(side=tk.LEFT)
-        for m in [2, 3, 4]:
+        for m in MULTIPLIERS:
             btn = ttk.Button(bottom_frame, text=f"x{m}", command=lambda mul=m: self.user_move(mul))
             btn.pack(side=tk.LEFT, padx=5)
 
     def start_game(self):
-        global NODES_VISITED
-        NODES_VISITED = 0
+        TT.clear()
         self.nodes_label_var.set("Visited Nodes: 0")
         self.time_label_var.set("Move Time: 0.000s")
+        self.depth_label_var.set("Search Depth: 0")
         self.game_over = False
+        self.game_id += 1
+        self.cancel_computer_turn()
 
         init_num = self.initial_num.get()
         first_p = Player.HUMAN if self.first_player.get() == "Human" else Player.COMPUTER
@@ -269,11 +437,15 @@ class GameGUI:
             computer_score=0,
             current_player=first_p
         )
+        if self.algorithm.get() == "Precomputed":
+            # Solve the whole game up front so every computer move is a lookup
+            solve_game(init_num, 0, 0, first_p)
+
         self.update_display()
 
         # If computer goes first, let it move after a short delay
         if self.state.current_player == Player.COMPUTER:
-            self.root.after(500, self.computer_turn)
+            self.schedule_computer_turn()
 
     def restart_game(self):
         self.start_game()
@@ -284,25 +456,91 @@ class GameGUI:
         self.apply_move(multiplier)
         self.update_display()
         if not self.game_over and self.state.current_player == Player.COMPUTER:
-            self.root.after(500, self.computer_turn)
+            self.schedule_computer_turn()
+
+    def schedule_computer_turn(self):
+        """
+        Let the computer move after a short delay, replacing any computer turn
+        that is already scheduled.
+        """
+        self.cancel_computer_turn()
+        self.pending_turn = self.root.after(500, self.computer_turn)
+
+    def cancel_computer_turn(self):
+        if self.pending_turn is not None:
+            self.root.after_cancel(self.pending_turn)
+            self.pending_turn = None
 
     def computer_turn(self):
+        self.pending_turn = None
         if self.game_over or self.state.current_player != Player.COMPUTER:
             return
+        if self.search_game_id == self.game_id:
+            return  # Already searching for this move
+
+        self.search_game_id = self.game_id
 
-        global NODES_VISITED
-        NODES_VISITED = 0
+        self.status_label_var.set("Computer is thinking...")
 
-        start_time = time.time()
-        move = computer_move(self.state, self.algorithm.get(), depth=10)
-        elapsed = time.time() - start_time
+        # Search in a worker thread so the Tk event loop stays responsive;
+        # the worker gets its own copy of the state and the settings it needs
+        snapshot = GameState(
+            self.state.current_number,
+            self.state.human_score,
+            self.state.computer_score,
+            self.state.current_player
+        )
+        worker = threading.Thread(
+            target=self.search_worker,
+            args=(snapshot, self.algorithm.get(), 10, self.game_id),
+            daemon=True
+        )
+        worker.start()
+
+    def search_worker(self, state, algorithm, depth, game_id):
+        """
+        Runs in the worker thread: search for the computer's move and hand the
+        result back to the Tk main thread.
+        """
+        start_time = time.perf_counter_ns()
+        try:
+            move, nodes, depth = computer_move(state, algorithm, depth=depth)
+        except Exception as exc:
+            self.root.after(0, self.fail_computer_turn, game_id, exc)
+            return
+        elapsed = (time.perf_counter_ns() - start_time) / 1e9
+        self.root.after(0, self.finish_computer_turn, game_id, move,
+                        elapsed, nodes, depth)
 
-        self.nodes_label_var.set(f"Visited Nodes: {NODES_VISITED}")
+    def finish_computer_turn(self, game_id, move, elapsed, nodes, depth):
+        """
+        Runs in the Tk main thread once the worker has found a move.
+        """
+        if game_id != self.game_id:
+            return  # The game was restarted while the computer was thinking
+        self.search_game_id = None
+        if self.game_over or self.state.current_player != Player.COMPUTER:
+            return
+
+        self.nodes_label_var.set(f"Visited Nodes: {nodes}")
         self.time_label_var.set(f"Move Time: {elapsed:.3f}s")
+        if depth is None:
+            self.depth_label_var.set("Search Depth: full game")
+        else:
+            self.depth_label_var.set(f"Search Depth: {depth}")
 
         self.apply_move(move)
         self.update_display()
 
+    def fail_computer_turn(self, game_id, exc):
+        """
+        Runs in the Tk main thread when the worker's search raised an error.
+        """
+        if game_id != self.game_id:
+            return
+        self.search_game_id = None
+        self.status_label_var.set(f"Computer move failed: {exc}")
+
     def apply_move(self, multiplier):
         """
         Multiply the current number by 2, 3, or 4.
@@ -310,32 +548,10 @@ class GameGUI:
         - If odd  => current player's score +1
         - If result >= 1200 => game ends immediately
         """
-        new_number = self.state.current_number * multiplier
-
-        if new_number % 2 == 0:
-            # Even => Opponent loses 1 point
-            if self.state.current_player == Player.HUMAN:
-                self.state.computer_score -= 1
-            else:
-                self.state.human_score -= 1
-        else:
-            # Odd => Current player gains 1 point
-            if self.state.current_player == Player.HUMAN:
-                self.state.human_score += 1
-            else:
-                self.state.computer_score += 1
-
-        self.state.current_number = new_number
-
-        if new_number >= 1200:
+        make_move(self.state, multiplier)
+        if is_terminal(self.state):
             # Game ends immediately
             self.game_over = True
-        else:
-            # Switch turn if game not over
-            if self.state.current_player == Player.HUMAN:
-                self.state.current_player = Player.COMPUTER
-            else:
-                self.state.current_player = Player.HUMAN
 
     def update_display(self):
         """
@@ -366,6 +582,8 @@ class GameGUI:
 ###############################################################################
 
 if __name__ == "__main__":
+    if search_nb is not None:
+        search_nb.warm_up()
     root = tk.Tk()
     GameGUI(root)
     root.mainloop()
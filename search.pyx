@@ -0,0 +1,105 @@
+# cython: language_level=3
+"""
+Cython-compiled Alpha-Beta search for the multiplication game.
+
+Same algorithm as search_nb.ab, compiled ahead of time to C, so there is no
+JIT warm-up. The recursion only touches C ints and runs without the GIL.
+
+Build in place with:
+
+    python setup.py build_ext --inplace
+
+MI_Project.py only offers the Cython algorithm when the compiled module
+imports.
+"""
+
+cdef long C_INF = 1000000000  # Alpha/beta sentinel, larger than any evaluation
+INF = C_INF
+
+
+cdef inline long evaluate(long hs, long cs, bint terminal) noexcept nogil:
+    cdef long diff = cs - hs
+    if terminal:
+        if diff > 0:
+            return 999999
+        elif diff < 0:
+            return -999999
+        return 0
+    return diff
+
+
+cdef long ab(long cur_num, long hs, long cs, int player, int depth,
+             long alpha, long beta, bint maximizing,
+             long* out_move, long* nodes) noexcept nogil:
+    """
+    Alpha-Beta search on C ints. Returns the value; the best move (0 at
+    leaves) is written to out_move and every expanded node is added to nodes.
+    """
+    cdef bint terminal = cur_num >= 1200
+    cdef long best_value, val, new_num, child_hs, child_cs, odd, even
+    cdef long best_move = 0
+    cdef long child_move = 0
+    cdef int i, move, child_player
+    cdef int order[3]
+
+    nodes[0] += 1
+    out_move[0] = 0
+    if terminal or depth == 0:
+        return evaluate(hs, cs, terminal)
+
+    # Same static move ordering as MI_Project.MOVE_ORDER
+    if cur_num & 1:
+        order[0] = 3
+        order[1] = 4
+        order[2] = 2
+    else:
+        order[0] = 4
+        order[1] = 2
+        order[2] = 3
+
+    best_value = -C_INF if maximizing else C_INF
+    for i in range(3):
+        move = order[i]
+        new_num = cur_num * move
+        # Odd => current player gains 1 point, even => opponent loses 1 point
+        odd = new_num & 1
+        even = 1 - odd
+        child_hs = hs + odd * (1 - player) - even * player
+        child_cs = cs + odd * player - even * (1 - player)
+        # Switch player only if the game does not end
+        child_player = player if new_num >= 1200 else 1 - player
+
+        val = ab(new_num, child_hs, child_cs, child_player, depth - 1,
+                 alpha, beta, not maximizing, &child_move, nodes)
+        if maximizing:
+            if val > best_value:
+                best_value = val
+                best_move = move
+            if best_value > alpha:
+                alpha = best_value
+        else:
+            if val < best_value:
+                best_value = val
+                best_move = move
+            if best_value < beta:
+                beta = best_value
+        if alpha >= beta:
+            break  # Alpha-Beta prune
+
+    out_move[0] = best_move
+    return best_value
+
+
+def alpha_beta_c(long cur_num, long hs, long cs, int player, int depth,
+                 long alpha, long beta, bint maximizing):
+    """
+    Python entry point. Returns (best_value, best_move, nodes_visited) like
+    search_nb.ab; the GIL is released while the search runs.
+    """
+    cdef long value
+    cdef long move = 0
+    cdef long nodes = 0
+    with nogil:
+        value = ab(cur_num, hs, cs, player, depth, alpha, beta, maximizing,
+                   &move, &nodes)
+    return value, move, nodes
@@ -0,0 +1,102 @@
+"""
+Numba-compiled Alpha-Beta search for the multiplication game.
+
+The search state is four ints (current number, human score, computer score,
+current player), so the whole recursion compiles in nopython mode. Everything
+stays in int64: the alpha/beta sentinels are large ints instead of float
+infinities, and "no move" is encoded as 0.
+
+ab releases the GIL, so the Tk main thread stays responsive while the GUI's
+worker thread runs it. This module requires numba; MI_Project.py only offers
+the JIT algorithm when the import succeeds.
+"""
+
+from numba import njit
+
+COMPUTER = 1  # Player.COMPUTER in MI_Project.py
+
+INF = 10 ** 9  # Alpha/beta sentinel, larger than any evaluation
+
+
+@njit(cache=True)
+def evaluate(hs, cs, terminal):
+    """
+    Same evaluation as MI_Project.evaluate: +-999999 / 0 for finished games,
+    otherwise the score difference from the computer's point of view.
+    """
+    diff = cs - hs
+    if terminal:
+        return 999999 if diff > 0 else -999999 if diff < 0 else 0
+    return diff
+
+
+@njit(cache=True, nogil=True)
+def ab(cur_num, hs, cs, player, depth, alpha, beta, maximizing):
+    """
+    Alpha-Beta search on primitive ints.
+
+    Returns (best_value, best_move, nodes_visited) like the Python searches;
+    best_move is 0 at leaves.
+    """
+    terminal = cur_num >= 1200
+    if terminal or depth == 0:
+        return evaluate(hs, cs, terminal), 0, 1
+
+    nodes = 1
+    best_move = 0
+    if maximizing:
+        best_value = -INF
+    else:
+        best_value = INF
+
+    child_depth = depth - 1
+    child_maximizing = not maximizing
+
+    # Same static move ordering as MI_Project.MOVE_ORDER
+    if cur_num & 1:
+        order = (3, 4, 2)
+    else:
+        order = (4, 2, 3)
+
+    # range() compiles to a plain counted loop, no list is built
+    for i in range(3):
+        move = order[i]
+        new_num = cur_num * move
+        # Branchless scoring: odd => current player gains 1 point,
+        # even => opponent loses 1 point. With player 0 = human, 1 = computer:
+        #   HUMAN,    odd:  hs + 1      HUMAN,    even: cs - 1
+        #   COMPUTER, odd:  cs + 1      COMPUTER, even: hs - 1
+        odd = new_num & 1
+        even = 1 - odd
+        child_hs = hs + odd * (1 - player) - even * player
+        child_cs = cs + odd * player - even * (1 - player)
+        # Switch player only if the game does not end
+        child_player = player if new_num >= 1200 else 1 - player
+
+        val, _, sub_nodes = ab(new_num, child_hs, child_cs, child_player,
+                               child_depth, alpha, beta, child_maximizing)
+        nodes += sub_nodes
+        if maximizing:
+            if val > best_value:
+                best_value = val
+                best_move = move
+            if best_value > alpha:
+                alpha = best_value
+        else:
+            if val < best_value:
+                best_value = val
+                best_move = move
+            if best_value < beta:
+                beta = best_value
+        if alpha >= beta:
+            break  # Alpha-Beta prune
+
+    return best_value, best_move, nodes
+
+
+def warm_up():
+    """
+    Compile ab for the int64 signature used by the GUI, so the JIT cost is
+    paid at startup instead of on the computer's first move.
+    """
+    ab(8, 0, 0, COMPUTER, 1, -INF, INF, True)
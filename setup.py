@@ -0,0 +1,13 @@
+"""
+Builds the optional Cython search extension (search.pyx):
+
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="multiplication-game-search",
+    ext_modules=cythonize("search.pyx"),
+)